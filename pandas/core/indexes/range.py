@@ -1,4 +1,6 @@
+import contextlib
 from datetime import timedelta
+import math
 import operator
 from sys import getsizeof
 from typing import Union
@@ -13,8 +15,8 @@ from pandas.util._decorators import Appender, cache_readonly
 
 from pandas.core.dtypes import concat as _concat
 from pandas.core.dtypes.common import (
-    ensure_python_int, is_int64_dtype, is_integer, is_scalar,
-    is_timedelta64_dtype)
+    ensure_platform_int, ensure_python_int, is_int64_dtype, is_integer,
+    is_list_like, is_scalar, is_signed_integer_dtype, is_timedelta64_dtype)
 from pandas.core.dtypes.generic import (
     ABCDataFrame, ABCSeries, ABCTimedeltaIndex)
 
@@ -24,8 +26,6 @@ import pandas.core.indexes.base as ibase
 from pandas.core.indexes.base import Index, _index_shared_docs
 from pandas.core.indexes.numeric import Int64Index
 
-from pandas.io.formats.printing import pprint_thing
-
 
 class RangeIndex(Int64Index):
     """
@@ -212,7 +212,8 @@ class RangeIndex(Int64Index):
         return None
 
     def _format_with_header(self, header, na_rep='NaN', **kwargs):
-        return header + list(map(pprint_thing, self._range))
+        # pprint_thing of a Python int is just its str
+        return header + list(map(str, self._range))
 
     # --------------------------------------------------------------------
     _deprecation_message = ("RangeIndex.{} is deprecated and will be "
@@ -325,11 +326,11 @@ class RangeIndex(Int64Index):
 
     @cache_readonly
     def is_monotonic_increasing(self):
-        return self._range.step > 0 or len(self) <= 1
+        return self._range.step > 0 or self._length <= 1
 
     @cache_readonly
     def is_monotonic_decreasing(self):
-        return self._range.step < 0 or len(self) <= 1
+        return self._range.step < 0 or self._length <= 1
 
     @property
     def has_duplicates(self):
@@ -337,21 +338,61 @@ class RangeIndex(Int64Index):
 
     def __contains__(self, key: Union[int, np.integer]) -> bool:
         hash(key)
-        try:
-            key = ensure_python_int(key)
-        except TypeError:
-            return False
+        if type(key) is not int:
+            try:
+                key = ensure_python_int(key)
+            except TypeError:
+                return False
         return key in self._range
 
     @Appender(_index_shared_docs['get_loc'])
     def get_loc(self, key, method=None, tolerance=None):
         if is_integer(key) and method is None and tolerance is None:
+            # range.index only has an O(1) path for Python ints, numpy
+            # integers would be searched for linearly
             try:
-                return self._range.index(key)
+                return self._range.index(int(key))
             except ValueError:
                 raise KeyError(key)
         return super().get_loc(key, method=method, tolerance=tolerance)
 
+    @Appender(_index_shared_docs['get_indexer'] % ibase._index_doc_kwargs)
+    def get_indexer(self, target, method=None, limit=None, tolerance=None):
+        if (com._any_not_none(method, tolerance, limit) or
+                not is_list_like(target)):
+            return super().get_indexer(target, method=method,
+                                       tolerance=tolerance, limit=limit)
+
+        target_array = np.asarray(target)
+        if not (is_signed_integer_dtype(target_array) and
+                target_array.ndim == 1):
+            # checks/conversions/roundings are delegated to general method
+            return super().get_indexer(target, method=method,
+                                       tolerance=tolerance)
+
+        if self.step > 0:
+            start, stop, step = self.start, self.stop, self.step
+        else:
+            # work on the reversed (increasing) range for simplicity
+            reverse = self._range[::-1]
+            start, stop, step = reverse.start, reverse.stop, reverse.step
+
+        # locate the targets arithmetically, without building the engine;
+        # check the bounds before subtracting start, so that the difference
+        # cannot overflow
+        locs = target_array.astype(np.int64)
+        valid = (locs >= start) & (locs < stop)
+        diff = locs[valid] - start
+        on_step = diff % step == 0
+        valid[valid] = on_step
+        locs[~valid] = -1
+        locs[valid] = diff[on_step] // step
+
+        if step != self.step:
+            # we reversed the range: transform to the original locations
+            locs[valid] = self._length - 1 - locs[valid]
+        return ensure_platform_int(locs)
+
     def tolist(self):
         return list(self._range)
 
@@ -372,27 +413,21 @@ class RangeIndex(Int64Index):
             name = self.name
         return self.from_range(self._range, name=name)
 
-    def _minmax(self, meth):
-        no_steps = len(self) - 1
-        if no_steps == -1:
-            return np.nan
-        elif ((meth == 'min' and self.step > 0) or
-              (meth == 'max' and self.step < 0)):
-            return self.start
-
-        return self.start + self.step * no_steps
-
     def min(self, axis=None, skipna=True, *args, **kwargs):
         """The minimum value of the RangeIndex"""
         nv.validate_minmax_axis(axis)
         nv.validate_min(args, kwargs)
-        return self._minmax('min')
+        if not self._length:
+            return np.nan
+        return self.start if self.step > 0 else self._end
 
     def max(self, axis=None, skipna=True, *args, **kwargs):
         """The maximum value of the RangeIndex"""
         nv.validate_minmax_axis(axis)
         nv.validate_max(args, kwargs)
-        return self._minmax('max')
+        if not self._length:
+            return np.nan
+        return self.start if self.step < 0 else self._end
 
     def argsort(self, *args, **kwargs):
         """
@@ -410,14 +445,16 @@ class RangeIndex(Int64Index):
         nv.validate_argsort(args, kwargs)
 
         if self._range.step > 0:
-            return np.arange(len(self))
+            return np.arange(self._length)
         else:
-            return np.arange(len(self) - 1, -1, -1)
+            return np.arange(self._length - 1, -1, -1)
 
     def equals(self, other):
         """
         Determines if two Index objects contain the same elements.
         """
+        if self is other:
+            return True
         if isinstance(other, RangeIndex):
             return self._range == other._range
         return super().equals(other)
@@ -464,42 +501,34 @@ class RangeIndex(Int64Index):
         if int_high <= int_low:
             return self._simple_new(None)
 
+        # check whether element sets intersect before solving for the
+        # Bezout coefficients, the common disjoint case needs only the gcd
+        if (first.start - second.start) % math.gcd(first.step, second.step):
+            return self._simple_new(None)
+
         # Method hint: linear Diophantine equation
         # solve intersection problem
         # performance hint: for identical step sizes, could use
         # cheaper alternative
         gcd, s, t = self._extended_gcd(first.step, second.step)
 
-        # check whether element sets intersect
-        if (first.start - second.start) % gcd:
-            return self._simple_new(None)
-
         # calculate parameters for the RangeIndex describing the
         # intersection disregarding the lower bounds
         tmp_start = first.start + (second.start - first.start) * \
             first.step // gcd * s
         new_step = first.step * second.step // gcd
-        new_index = self._simple_new(tmp_start, int_high, new_step)
-
-        # adjust index to limiting interval
-        new_start = new_index._min_fitting_element(int_low)
-        new_index = self._simple_new(new_start, new_index.stop, new_index.step)
-
-        if (self.step < 0 and other.step < 0) is not (new_index.step < 0):
-            new_index = new_index[::-1]
-        if sort is None:
-            new_index = new_index.sort_values()
-        return new_index
 
-    def _min_fitting_element(self, lower_limit):
-        """Returns the smallest element greater than or equal to the limit"""
-        no_steps = -(-(lower_limit - self.start) // abs(self.step))
-        return self.start + abs(self.step) * no_steps
+        # adjust the start to the limiting interval and build the result
+        # only once
+        new_start = _min_fitting_element(tmp_start, new_step, int_low)
+        new_range = range(new_start, int_high, new_step)
 
-    def _max_fitting_element(self, upper_limit):
-        """Returns the largest element smaller than or equal to the limit"""
-        no_steps = (upper_limit - self.start) // abs(self.step)
-        return self.start + abs(self.step) * no_steps
+        # the result is increasing, only reverse it if both inputs are
+        # decreasing and it does not have to be sorted
+        if self.step < 0 and other.step < 0 and sort is not None:
+            new_range = new_range[::-1]
+        return self._simple_new(new_range.start, new_range.stop,
+                                new_range.step)
 
     def _extended_gcd(self, a, b):
         """
@@ -538,53 +567,63 @@ class RangeIndex(Int64Index):
         -------
         union : Index
         """
-        if not len(other) or self.equals(other) or not len(self):
+        if not len(other) or self.equals(other) or not self._length:
             return super()._union(other, sort=sort)
 
         if isinstance(other, RangeIndex) and sort is None:
+            len_s, len_o = self._length, other._length
             start_s, step_s = self.start, self.step
-            end_s = self.start + self.step * (len(self) - 1)
             start_o, step_o = other.start, other.step
-            end_o = other.start + other.step * (len(other) - 1)
-            if self.step < 0:
+            end_s, end_o = self._end, other._end
+            if step_s < 0:
                 start_s, step_s, end_s = end_s, -step_s, start_s
-            if other.step < 0:
+            if step_o < 0:
                 start_o, step_o, end_o = end_o, -step_o, start_o
-            if len(self) == 1 and len(other) == 1:
-                step_s = step_o = abs(self.start - other.start)
-            elif len(self) == 1:
+            if len_s == 1 and len_o == 1:
+                step_s = step_o = abs(start_s - start_o)
+            elif len_s == 1:
                 step_s = step_o
-            elif len(other) == 1:
+            elif len_o == 1:
                 step_o = step_s
             start_r = min(start_s, start_o)
             end_r = max(end_s, end_o)
+            # the bounds below are Python ints, so the result can skip the
+            # validation done by the constructor
             if step_o == step_s:
                 if ((start_s - start_o) % step_s == 0 and
                         (start_s - end_o) <= step_s and
                         (start_o - end_s) <= step_s):
-                    return self.__class__(start_r, end_r + step_s, step_s)
+                    return self._simple_new(start_r, end_r + step_s, step_s)
+                half_step = step_s // 2
                 if ((step_s % 2 == 0) and
-                        (abs(start_s - start_o) <= step_s / 2) and
-                        (abs(end_s - end_o) <= step_s / 2)):
-                    return self.__class__(start_r,
-                                          end_r + step_s / 2,
-                                          step_s / 2)
+                        (abs(start_s - start_o) <= half_step) and
+                        (abs(end_s - end_o) <= half_step)):
+                    return self._simple_new(start_r, end_r + half_step,
+                                            half_step)
             elif step_o % step_s == 0:
                 if ((start_o - start_s) % step_s == 0 and
                         (start_o + step_s >= start_s) and
                         (end_o - step_s <= end_s)):
-                    return self.__class__(start_r, end_r + step_s, step_s)
+                    return self._simple_new(start_r, end_r + step_s, step_s)
             elif step_s % step_o == 0:
                 if ((start_s - start_o) % step_o == 0 and
                         (start_s + step_o >= start_o) and
                         (end_s - step_o <= end_o)):
-                    return self.__class__(start_r, end_r + step_o, step_o)
+                    return self._simple_new(start_r, end_r + step_o, step_o)
         return self._int64index._union(other, sort=sort)
 
     @Appender(_index_shared_docs['join'])
     def join(self, other, how='left', level=None, return_indexers=False,
              sort=False):
         if how == 'outer' and self is not other:
+            if (isinstance(other, RangeIndex) and
+                    self._range == other._range and
+                    (not sort or self.is_monotonic_increasing)):
+                # same (already sorted if required) elements: no need to
+                # materialize the int64 values
+                if return_indexers:
+                    return self, None, None
+                return self
             # note: could return RangeIndex in more circumstances
             return self._int64index.join(other, how, level, return_indexers,
                                          sort)
@@ -594,15 +633,32 @@ class RangeIndex(Int64Index):
     def _concat_same_dtype(self, indexes, name):
         return _concat._concat_rangeindex_same_dtype(indexes).rename(name)
 
+    @cache_readonly
+    def _length(self):
+        """
+        The length of the underlying range, computed once as the
+        RangeIndex is immutable
+        """
+        return len(self._range)
+
+    @cache_readonly
+    def _end(self):
+        """
+        The last element of the range (``start`` if it is empty)
+        """
+        if not self._length:
+            return self.start
+        return self.start + self.step * (self._length - 1)
+
     def __len__(self):
         """
         return the length of the RangeIndex
         """
-        return len(self._range)
+        return self._length
 
     @property
     def size(self):
-        return len(self)
+        return self._length
 
     def __getitem__(self, key):
         """
@@ -627,7 +683,8 @@ class RangeIndex(Int64Index):
                                                            size=len(self)))
         if isinstance(key, slice):
             new_range = self._range[key]
-            return self.from_range(new_range, name=self.name)
+            return self._simple_new(new_range.start, new_range.stop,
+                                    new_range.step, name=self.name)
 
         # fall back to Int64Index
         return super_getitem(key)
@@ -653,7 +710,8 @@ class RangeIndex(Int64Index):
         return 0 not in self._range
 
     def any(self) -> bool:
-        return any(self._range)
+        # step is never zero, so only the first element can be zero
+        return self._length > 1 or (self._length == 1 and self.start != 0)
 
     @classmethod
     def _add_numeric_methods_binary(cls):
@@ -685,30 +743,38 @@ class RangeIndex(Int64Index):
                     return op(self._int64index, other)
 
                 other = self._validate_for_numeric_binop(other, op)
-                attrs = self._get_attributes_dict()
-                attrs = self._maybe_update_attributes(attrs)
 
                 left, right = self, other
 
+                if type(right) in (int, float):
+                    # arithmetic on plain Python scalars is not subject to
+                    # numpy's floating point error handling; suppress() with
+                    # no arguments is a no-op context manager
+                    errstate = contextlib.suppress()
+                else:
+                    errstate = np.errstate(all='ignore')
+
                 try:
-                    # apply if we have an override
-                    if step:
-                        with np.errstate(all='ignore'):
+                    with errstate:
+                        # apply if we have an override
+                        if step:
                             rstep = step(left.step, right)
 
-                        # we don't have a representable op
-                        # so return a base index
-                        if not is_integer(rstep) or not rstep:
-                            raise ValueError
+                            # we don't have a representable op
+                            # so return a base index
+                            if not is_integer(rstep) or not rstep:
+                                raise ValueError
 
-                    else:
-                        rstep = left.step
+                        else:
+                            rstep = left.step
 
-                    with np.errstate(all='ignore'):
                         rstart = op(left.start, right)
                         rstop = op(left.stop, right)
 
-                    result = self.__class__(rstart, rstop, rstep, **attrs)
+                    # name is the only attribute of a RangeIndex and is not
+                    # updated by the op, see _maybe_update_attributes
+                    result = self.__class__(rstart, rstop, rstep,
+                                            name=self.name)
 
                     # for compat with numpy / Int64Index
                     # even if we can represent as a RangeIndex, return
@@ -719,7 +785,8 @@ class RangeIndex(Int64Index):
 
                     return result
 
-                except (ValueError, TypeError, ZeroDivisionError):
+                except (ValueError, TypeError, ZeroDivisionError,
+                        OverflowError):
                     # Defer to Int64Index implementation
                     return op(self._int64index, other)
                     # TODO: Do attrs get handled reliably?
@@ -739,4 +806,12 @@ class RangeIndex(Int64Index):
                                                 step=ops.rtruediv)
 
 
+def _min_fitting_element(start, step, lower_limit):
+    """
+    Returns the smallest element greater than or equal to the limit of the
+    arithmetic progression through `start` with positive `step`
+    """
+    return start - (start - lower_limit) // step * step
+
+
 RangeIndex._add_numeric_methods()
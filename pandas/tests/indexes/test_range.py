@@ -5,6 +5,7 @@ import pytest
 
 import pandas as pd
 from pandas import Float64Index, Index, Int64Index, RangeIndex, Series
+from pandas.core.indexes.range import _min_fitting_element
 import pandas.util.testing as tm
 
 from .test_numeric import Numeric
@@ -346,6 +347,14 @@ class TestRangeIndex(Numeric):
         assert idx.all() == idx.values.all()
         assert idx.any() == idx.values.any()
 
+    @pytest.mark.parametrize('start, stop, step', [
+        (0, 0, 1), (0, 1, 1), (1, 2, 1), (0, 2, 1), (0, -5, -1), (3, 0, -3),
+        (-1, 5, 2)])
+    def test_any_all(self, start, stop, step):
+        idx = RangeIndex(start, stop, step)
+        assert idx.all() == idx.values.all()
+        assert idx.any() == idx.values.any()
+
     def test_identical(self):
         i = Index(self.index.copy())
         assert i.identical(self.index)
@@ -374,6 +383,24 @@ class TestRangeIndex(Numeric):
         expected = np.array([0, -1, 1, -1, 2, -1, 3, -1, 4, -1], dtype=np.intp)
         tm.assert_numpy_array_equal(indexer, expected)
 
+    @pytest.mark.parametrize('stop', [-2, -1])
+    def test_get_indexer_decreasing(self, stop):
+        index = RangeIndex(10, stop, -2)
+        result = index.get_indexer(np.array([-2, 0, 1, 2, 6, 9, 10, 12]))
+        expected = np.array([-1, 5, -1, 4, 2, -1, 0, -1], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+        assert index._cached_data is None
+
+    @pytest.mark.parametrize('index, expected', [
+        (RangeIndex(10, 20), [-1, -1, 0, 9, -1]),
+        (RangeIndex(19, 9, -1), [-1, -1, 9, 0, -1])])
+    def test_get_indexer_int64_bounds(self, index, expected):
+        info = np.iinfo(np.int64)
+        target = np.array([info.min, info.max, 10, 19, 20], dtype=np.int64)
+        result = index.get_indexer(target)
+        expected = np.array(expected, dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+
     def test_get_indexer_pad(self):
         target = RangeIndex(10)
         indexer = self.index.get_indexer(target, method='pad')
@@ -554,6 +581,45 @@ class TestRangeIndex(Numeric):
             joined = self.index.join(self.index, how=kind)
             assert self.index is joined
 
+    @pytest.mark.parametrize('start, stop, step', [(0, 20, 2), (18, -2, -2)])
+    def test_join_outer_equal_range(self, start, stop, step):
+        idx = RangeIndex(start, stop, step)
+        other = RangeIndex(start, stop, step)
+
+        res, lidx, ridx = idx.join(other, how='outer', return_indexers=True)
+        assert res is idx
+        assert lidx is None
+        assert ridx is None
+        assert idx._cached_data is None
+        assert other._cached_data is None
+
+    def test_join_outer_equal_range_sort(self):
+        idx = RangeIndex(0, 20, 2)
+        res, lidx, ridx = idx.join(RangeIndex(0, 20, 2), how='outer',
+                                   return_indexers=True, sort=True)
+        assert res is idx
+        assert lidx is None
+        assert ridx is None
+
+        # decreasing ranges still have to be sorted
+        idx = RangeIndex(18, -2, -2)
+        res, lidx, ridx = idx.join(RangeIndex(18, -2, -2), how='outer',
+                                   return_indexers=True, sort=True)
+        tm.assert_index_equal(res, Int64Index(np.arange(0, 20, 2)))
+        expected = np.arange(9, -1, -1, dtype=np.intp)
+        tm.assert_numpy_array_equal(lidx, expected)
+        tm.assert_numpy_array_equal(ridx, expected)
+
+    @pytest.mark.parametrize('key', [40, np.int64(40), np.int32(40)])
+    def test_get_loc_integer_types(self, key):
+        idx = RangeIndex(0, 100, 10)
+        assert idx.get_loc(key) == 4
+        assert key in idx
+
+        with pytest.raises(KeyError):
+            idx.get_loc(key + 1)
+        assert key + 1 not in idx
+
     @pytest.mark.parametrize("sort", [None, False])
     def test_intersection(self, sort):
         # intersect with Int64Index
@@ -626,6 +692,15 @@ class TestRangeIndex(Numeric):
         expected = RangeIndex(0, 0, 1)
         tm.assert_index_equal(result, expected)
 
+    def test_intersection_sort_none_stays_lazy(self):
+        first = RangeIndex(10, -2, -2)
+        other = RangeIndex(5, -4, -1)
+        result = first.intersection(other, sort=None)
+        expected = RangeIndex(0, 6, 2)
+        tm.assert_index_equal(result, expected, exact=True)
+        assert first._cached_data is None
+        assert other._cached_data is None
+
     @pytest.mark.parametrize('sort', [False, None])
     def test_union_noncomparable(self, sort):
         from datetime import datetime, timedelta
@@ -807,41 +882,12 @@ class TestRangeIndex(Numeric):
         assert 2 == result[1] * 10 + result[2] * 6
         assert 2 == result[0]
 
-    def test_min_fitting_element(self):
-        result = RangeIndex(0, 20, 2)._min_fitting_element(1)
-        assert 2 == result
-
-        result = RangeIndex(1, 6)._min_fitting_element(1)
-        assert 1 == result
-
-        result = RangeIndex(18, -2, -2)._min_fitting_element(1)
-        assert 2 == result
-
-        result = RangeIndex(5, 0, -1)._min_fitting_element(1)
-        assert 1 == result
-
-        big_num = 500000000000000000000000
-
-        result = RangeIndex(5, big_num * 2, 1)._min_fitting_element(big_num)
-        assert big_num == result
-
-    def test_max_fitting_element(self):
-        result = RangeIndex(0, 20, 2)._max_fitting_element(17)
-        assert 16 == result
-
-        result = RangeIndex(1, 6)._max_fitting_element(4)
-        assert 4 == result
-
-        result = RangeIndex(18, -2, -2)._max_fitting_element(17)
-        assert 16 == result
-
-        result = RangeIndex(5, 0, -1)._max_fitting_element(4)
-        assert 4 == result
-
-        big_num = 500000000000000000000000
-
-        result = RangeIndex(5, big_num * 2, 1)._max_fitting_element(big_num)
-        assert big_num == result
+    @pytest.mark.parametrize('start, step, lower_limit, expected', [
+        (0, 2, 1, 2), (1, 1, 1, 1), (18, 2, 1, 2), (5, 1, 1, 1),
+        (5, 1, 500000000000000000000000, 500000000000000000000000)])
+    def test_min_fitting_element(self, start, step, lower_limit, expected):
+        result = _min_fitting_element(start, step, lower_limit)
+        assert result == expected
 
     def test_pickle_compat_construction(self):
         # RangeIndex() is a valid constructor